@@ -1,4 +1,4 @@
 #!/bin/sh
-python setup.py sdist bdist_wheel &&
+python -m build &&
 twine check dist/* &&
 twine upload dist/*
\ No newline at end of file
@@ -1,4 +1,4 @@
 #!/bin/sh
-python setup.py sdist bdist_wheel &&
+python -m build &&
 twine check dist/* &&
 twine upload --repository-url https://test.pypi.org/legacy/ dist/*
\ No newline at end of file
@@ -1,3 +1,6 @@
 from rctiplus_rabbitmq_python_sdk.message_payload import *
 from rctiplus_rabbitmq_python_sdk.rabbitmq import *
 from rctiplus_rabbitmq_python_sdk.aio_rabbitmq import *
+from rctiplus_rabbitmq_python_sdk.rabbitmq_pool import *
+from rctiplus_rabbitmq_python_sdk.aio_rabbitmq_pool import *
+from rctiplus_rabbitmq_python_sdk.aio_rabbitmq_producer import *
@@ -1,31 +1,82 @@
-import requests
+import aiohttp
 import urllib.parse
 import asyncio
+import warnings
 import aio_pika
-from rctiplus_rabbitmq_python_sdk import MessagePayload
-from typing import Callable
+from rctiplus_rabbitmq_python_sdk import MessageBody
+from rctiplus_rabbitmq_python_sdk.message_payload import _encode_body
+from typing import Callable, Iterable
+
+try:
+    import uvloop
+except ImportError:  # Optional, only needed by `install_uvloop`
+    uvloop = None
+
+
+def install_uvloop() -> bool:
+    """Use uvloop (libuv based event loop) for event loops created from now on.
+    Call this before creating the event loop, e.g. before `asyncio.get_event_loop()` or `asyncio.run()`
+
+    Returns:
+        bool: True if uvloop has been installed, False if it is not available
+    """
+    if uvloop is None:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def _build_url(host: str, port: int, username: str, password: str) -> str:
+    """Build AMQP connection URL
+
+    Args:
+        host (str): RabbitMQ host
+        port (int): RabbitMQ port
+        username (str): RabbitMQ username
+        password (str): RabbitMQ password
+
+    Returns:
+        str: AMQP connection URL
+    """
+    username = urllib.parse.quote(username)
+    password = urllib.parse.quote(password)
+    if port:
+        port = ':' + str(port)
+    else:
+        port = ''
+    return f'amqp://{username}:{password}@{host}{port}/'
+
 
 class AIORabbitMQ:
 
     def __init__(self, loop: asyncio.AbstractEventLoop = None, durable: bool = False,
-                 auto_ack: bool = True, auto_delete: bool = False) -> None:
+                 auto_ack: bool = True, auto_delete: bool = False, prefetch_count: int = 100,
+                 publisher_confirms: bool = True) -> None:
         """Python RabbitMQ library
 
         Args:
-            loop (asyncio.AbstractEventLoop, optional): Event loop (asyncio.get_event_loop() when None). Defaults to None
+            loop (asyncio.AbstractEventLoop, optional): Deprecated and ignored, the running event loop is used. Defaults to None
             durable (bool, optional): Durable mode, prevent from losing messages if RabbitMQ server stops or restarts. Defaults to False
             auto_ack (bool, optional): Auto acknowledgements, remove messages immadiatelly after being received. Defaults to True
             auto_delete (bool, optional): Delete created queue after consumer cancels, disconnects or when channel will be closed. Defaults to False
+            prefetch_count (int, optional): Maximum unacknowledged messages delivered to the consumer at once, 0 for unlimited. Only applies when `auto_ack` is False. Defaults to 100
+            publisher_confirms (bool, optional): Wait for RabbitMQ to confirm each published message. Disable for fire-and-forget publishing, messages may then be lost silently. Defaults to True
         """
-        self.loop = loop
+        if loop is not None:
+            warnings.warn('`loop` is deprecated and ignored, the running event loop is used', DeprecationWarning, stacklevel=2)
         self.durable = durable
         self.delivery_mode = None
         if self.durable:
             self.delivery_mode = aio_pika.DeliveryMode(2)  # Make messages persistence if durable mode active
         self.auto_ack = auto_ack
         self.auto_delete = auto_delete
+        self.prefetch_count = prefetch_count
+        self.publisher_confirms = publisher_confirms
         self.connection = None
         self.channel = None
+        self._amqp_url = None
+        self._declared_queues = {}
+        self._declared_exchanges = {}
 
     async def connect(self, host: str, port: int, username: str, password: str) -> None:
         """Connect to RabbitMQ server
@@ -36,17 +87,11 @@ class AIORabbitMQ:
             username (str): RabbitMQ username
             password (str): RabbitMQ password
         """
-        username = urllib.parse.quote(username)
-        password = urllib.parse.quote(password)
-        if port:
-            port = ':' + str(port)
-        else:
-            port = ''
-        self.connection = await aio_pika.connect_robust(
-            f'amqp://{username}:{password}@{host}{port}/',
-            loop=self.loop
-        )
-        self.channel = await self.connection.channel()
+        self._amqp_url = _build_url(host, port, username, password)  # Reused by `connect_robust` on reconnects
+        self.connection = await aio_pika.connect_robust(self._amqp_url)
+        self.channel = await self.connection.channel(publisher_confirms=self.publisher_confirms)
+        await self.channel.set_qos(prefetch_count=self.prefetch_count)
+        self._reset_declarations()
 
     async def disconnect(self) -> None:
         """Disconnect RabbitMQ connection
@@ -71,44 +116,124 @@ class AIORabbitMQ:
             list: List of queues
         """
         url = 'http://%s:%s/api/queues/%s' % (host, port, virtual_host or '')
-        response = requests.get(url, auth=(user, password))
-        queues = [q['name'] for q in response.json()]
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, auth=aiohttp.BasicAuth(user, password)) as response:
+                data = await response.json()
+        queues = [q['name'] for q in data]
         return queues
 
-    async def send(self, queue: str, body: MessagePayload, exchange: str = '') -> None:
+    def _reset_declarations(self) -> None:
+        """Forget cached queue/exchange declarations, they belong to the channel they were declared on.
+        Not needed after a reconnect or reopen, the robust channel redeclares its queues/exchanges (and restores consumers) itself
+        """
+        self._declared_queues = {}
+        self._declared_exchanges = {}
+
+    async def _ensure_channel(self) -> None:
+        """Reopen channel if it has been closed, e.g. by a failed declaration or a publish to a deleted exchange.
+        Only checks the channel state, no AMQP round-trip if it's open
+        """
+        if self.channel.is_closed:
+            await self.channel.reopen()  # Restores the cached queues/exchanges, the cache stays valid
+
+    async def _declare_queue(self, queue: str) -> aio_pika.Queue:
+        """Declare channel queue once, skip the AMQP round-trip if it has already been declared
+
+        Args:
+            queue (str): Queue name
+
+        Returns:
+            aio_pika.Queue: Declared queue
+        """
+        await self._ensure_channel()  # Cached queues too, the broker may close the channel without dropping the connection
+        if queue in self._declared_queues:
+            return self._declared_queues[queue]
+        declared = await self.channel.declare_queue(queue, durable=self.durable, auto_delete=self.auto_delete)
+        self._declared_queues[queue] = declared
+        return declared
+
+    async def _get_exchange(self, exchange: str) -> aio_pika.Exchange:
+        """Get channel exchange (default exchange for ''), skip the AMQP round-trip if it has already been declared
+
+        Args:
+            exchange (str): Exchange name
+
+        Returns:
+            aio_pika.Exchange: Declared exchange
+        """
+        await self._ensure_channel()  # Cached exchanges too, the broker may close the channel without dropping the connection
+        if exchange == '':
+            return self.channel.default_exchange
+        if exchange in self._declared_exchanges:
+            return self._declared_exchanges[exchange]
+        try:
+            declared = await self.channel.get_exchange(exchange)
+        except aio_pika.exceptions.ChannelClosed:
+            # Exchange doesn't exist (its type can't be guessed, so existing ones are only checked passively)
+            await self._ensure_channel()
+            declared = await self.channel.declare_exchange(exchange, auto_delete=self.auto_delete)
+        self._declared_exchanges[exchange] = declared
+        return declared
+
+    def prepare(self, body: MessageBody) -> aio_pika.Message:
+        """Build message to be published from message/body payload. The message can be published
+        many times with `send_prepared`, so the payload is only encoded once
+
+        Args:
+            body (MessageBody): Message/body payload, or already encoded bytes
+
+        Returns:
+            aio_pika.Message: Message to be published
+        """
+        return aio_pika.Message(
+            _encode_body(body),
+            delivery_mode=self.delivery_mode,
+            content_type=getattr(body, 'content_type', None),
+        )
+
+    async def send(self, queue: str, body: MessageBody, exchange: str = '') -> None:
         """Send message/body to RabbitMQ channel queue
 
         Args:
             queue (str): Queue name
-            body (MessagePayload): Message/body payload
+            body (MessageBody): Message/body payload, or already encoded bytes
             exchange (str, optional): Exchange name. Defaults to ''
         """
-        try:
-            await self.channel.get_queue(queue, ensure=True)
-        except:
-            await self.channel.reopen()
-            await self.channel.declare_queue(queue, durable=self.durable, auto_delete=self.auto_delete)
-        if exchange == '':
-            await self.channel.default_exchange.publish(
-                aio_pika.Message(
-                    bytes(str(body), 'utf-8'),
-                    delivery_mode=self.delivery_mode,
-                ),
-                queue,
-            )
-        else:
-            try:
-                exchange = await self.channel.get_exchange(exchange)
-            except:
-                await self.channel.reopen()
-                exchange = await self.channel.declare_exchange(exchange, auto_delete=self.auto_delete)
-            await exchange.publish(
-                aio_pika.Message(
-                    bytes(str(body), 'utf-8'),
-                    delivery_mode=self.delivery_mode,
-                ),
-                queue,
-            )
+        await self.send_prepared(queue, self.prepare(body), exchange)
+
+    async def send_prepared(self, queue: str, message: aio_pika.Message, exchange: str = '') -> None:
+        """Send message built by `prepare` to RabbitMQ channel queue
+
+        Args:
+            queue (str): Queue name
+            message (aio_pika.Message): Message built by `prepare`
+            exchange (str, optional): Exchange name. Defaults to ''
+        """
+        await self._declare_queue(queue)
+        exchange = await self._get_exchange(exchange)
+        await exchange.publish(message, queue)
+
+    async def send_many(self, queue: str, bodies: Iterable[MessageBody], exchange: str = '',
+                        batch_size: int = 100) -> None:
+        """Send many messages/bodies to RabbitMQ channel queue. Publishes are pipelined in batches and
+        their confirmations are awaited together, instead of waiting for each message one by one
+
+        Args:
+            queue (str): Queue name
+            bodies (Iterable[MessageBody]): Message/body payloads, or already encoded bytes
+            exchange (str, optional): Exchange name. Defaults to ''
+            batch_size (int, optional): Maximum number of publishes in flight at once. Defaults to 100
+        """
+        await self._declare_queue(queue)
+        exchange = await self._get_exchange(exchange)
+        messages = []
+        for body in bodies:
+            messages.append(self.prepare(body))
+            if len(messages) >= batch_size:
+                await asyncio.gather(*(exchange.publish(message, queue) for message in messages))
+                messages = []
+        if messages:
+            await asyncio.gather(*(exchange.publish(message, queue) for message in messages))
 
     async def receive(self, queue: str, callback: Callable[
         [
@@ -121,11 +246,7 @@ class AIORabbitMQ:
             queue (str): Queue name
             callback (Callable[ [ aio_pika.IncomingMessage ], None ]): Callback to be called after receiving a message
         """
-        try:
-            queue = await self.channel.get_queue(queue, ensure=True)
-        except:
-            await self.channel.reopen()
-            queue = await self.channel.declare_queue(queue, durable=self.durable, auto_delete=self.auto_delete)
+        queue = await self._declare_queue(queue)
         await queue.consume(callback, no_ack=self.auto_ack)
 
     async def delete_queue(self, queue: str) -> None:
@@ -135,6 +256,7 @@ class AIORabbitMQ:
             queue (str): Queue name to be deleted
         """
         await self.channel.queue_delete(queue)
+        self._declared_queues.pop(queue, None)
     
     async def delete_exchange(self, exchange: str) -> None:
         """Delete channel exchange
@@ -143,6 +265,7 @@ class AIORabbitMQ:
             exchange (str): Exchange name to be deleted
         """
         await self.channel.exchange_delete(exchange)
+        self._declared_exchanges.pop(exchange, None)
 
     async def commit_ack(self, incoming_message: aio_pika.IncomingMessage) -> None:
         """Do manual acknowledgements (if `auto_ack` is False), tells RabbitMQ that the message is free to delete.
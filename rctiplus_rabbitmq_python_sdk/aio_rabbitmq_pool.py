@@ -0,0 +1,144 @@
+import asyncio
+import weakref
+import aio_pika
+from aio_pika.pool import Pool
+from rctiplus_rabbitmq_python_sdk import MessageBody
+from rctiplus_rabbitmq_python_sdk.message_payload import _encode_body
+from rctiplus_rabbitmq_python_sdk.aio_rabbitmq import _build_url
+from typing import Iterable
+
+class AIORabbitMQPool:
+
+    def __init__(self, max_connections: int = 2, max_channels: int = 8, durable: bool = False,
+                 auto_delete: bool = False, publisher_confirms: bool = True) -> None:
+        """Python RabbitMQ library, publishes through a pool of connections & channels so concurrent tasks
+        don't have to share (or open) a single channel
+
+        Args:
+            max_connections (int, optional): Maximum number of connections in the pool. Defaults to 2
+            max_channels (int, optional): Maximum number of channels in the pool. Defaults to 8
+            durable (bool, optional): Durable mode, prevent from losing messages if RabbitMQ server stops or restarts. Defaults to False
+            auto_delete (bool, optional): Delete created queue after consumer cancels, disconnects or when channel will be closed. Defaults to False
+            publisher_confirms (bool, optional): Wait for RabbitMQ to confirm each published message. Disable for fire-and-forget publishing, messages may then be lost silently. Defaults to True
+        """
+        self.max_connections = max_connections
+        self.max_channels = max_channels
+        self.durable = durable
+        self.delivery_mode = None
+        if self.durable:
+            self.delivery_mode = aio_pika.DeliveryMode(2)  # Make messages persistence if durable mode active
+        self.auto_delete = auto_delete
+        self.publisher_confirms = publisher_confirms
+        self.connection_pool = None
+        self.channel_pool = None
+        self._declared_queues = set()
+        self._exchanges = weakref.WeakKeyDictionary()  # Exchange objects per pooled channel
+
+    async def connect(self, host: str, port: int, username: str, password: str) -> None:
+        """Create connection & channel pools to RabbitMQ server, connections and channels are opened on demand
+
+        Args:
+            host (str): RabbitMQ host
+            port (int): RabbitMQ port
+            username (str): RabbitMQ username
+            password (str): RabbitMQ password
+        """
+        url = _build_url(host, port, username, password)
+
+        async def get_connection() -> aio_pika.RobustConnection:
+            return await aio_pika.connect_robust(url)
+
+        async def get_channel() -> aio_pika.Channel:
+            async with self.connection_pool.acquire() as connection:
+                return await connection.channel(publisher_confirms=self.publisher_confirms)
+
+        self.connection_pool = Pool(get_connection, max_size=self.max_connections)
+        self.channel_pool = Pool(get_channel, max_size=self.max_channels)
+        self._declared_queues = set()
+        self._exchanges = weakref.WeakKeyDictionary()  # Exchange objects per pooled channel
+
+    async def disconnect(self) -> None:
+        """Close all pooled channels & connections
+        """
+        await self.channel_pool.close()
+        await self.connection_pool.close()
+
+    async def _get_exchange(self, channel: aio_pika.Channel, queue: str, exchange: str) -> aio_pika.Exchange:
+        """Declare queue once for the whole pool (it lives on the server, not on the channel)
+        and get the exchange bound to the given channel, looked up once per channel
+
+        Args:
+            channel (aio_pika.Channel): Pooled channel
+            queue (str): Queue name
+            exchange (str): Exchange name
+
+        Returns:
+            aio_pika.Exchange: Exchange to publish to
+        """
+        if channel.is_closed:
+            # The pool hands channels back without a health check, reopen one closed by the broker
+            # (e.g. a failed declaration or a publish to a deleted exchange)
+            await channel.reopen()
+        if queue not in self._declared_queues:
+            await channel.declare_queue(queue, durable=self.durable, auto_delete=self.auto_delete)
+            self._declared_queues.add(queue)
+        if exchange == '':
+            return channel.default_exchange
+        exchanges = self._exchanges.setdefault(channel, {})
+        if exchange not in exchanges:
+            # Declared exchanges are registered on the robust channel, so they are restored when it reopens
+            try:
+                exchanges[exchange] = await channel.get_exchange(exchange, ensure=True)
+            except aio_pika.exceptions.ChannelClosed:
+                await channel.reopen()
+                exchanges[exchange] = await channel.declare_exchange(exchange, auto_delete=self.auto_delete)
+        return exchanges[exchange]
+
+    def prepare(self, body: MessageBody) -> aio_pika.Message:
+        """Build message to be published from message/body payload
+
+        Args:
+            body (MessageBody): Message/body payload, or already encoded bytes
+
+        Returns:
+            aio_pika.Message: Message to be published
+        """
+        return aio_pika.Message(
+            _encode_body(body),
+            delivery_mode=self.delivery_mode,
+            content_type=getattr(body, 'content_type', None),
+        )
+
+    async def send(self, queue: str, body: MessageBody, exchange: str = '') -> None:
+        """Send message/body to RabbitMQ channel queue using a pooled channel
+
+        Args:
+            queue (str): Queue name
+            body (MessageBody): Message/body payload, or already encoded bytes
+            exchange (str, optional): Exchange name. Defaults to ''
+        """
+        async with self.channel_pool.acquire() as channel:
+            exchange = await self._get_exchange(channel, queue, exchange)
+            await exchange.publish(self.prepare(body), queue)
+
+    async def send_many(self, queue: str, bodies: Iterable[MessageBody], exchange: str = '',
+                        batch_size: int = 100) -> None:
+        """Send many messages/bodies to RabbitMQ channel queue using a pooled channel. Publishes are pipelined
+        in batches and their confirmations are awaited together
+
+        Args:
+            queue (str): Queue name
+            bodies (Iterable[MessageBody]): Message/body payloads, or already encoded bytes
+            exchange (str, optional): Exchange name. Defaults to ''
+            batch_size (int, optional): Maximum number of publishes in flight at once. Defaults to 100
+        """
+        async with self.channel_pool.acquire() as channel:
+            exchange = await self._get_exchange(channel, queue, exchange)
+            messages = []
+            for body in bodies:
+                messages.append(self.prepare(body))
+                if len(messages) >= batch_size:
+                    await asyncio.gather(*(exchange.publish(message, queue) for message in messages))
+                    messages = []
+            if messages:
+                await asyncio.gather(*(exchange.publish(message, queue) for message in messages))
@@ -0,0 +1,101 @@
+import asyncio
+from rctiplus_rabbitmq_python_sdk import MessageBody
+from rctiplus_rabbitmq_python_sdk.aio_rabbitmq import AIORabbitMQ
+
+class AIORabbitMQProducer:
+
+    def __init__(self, connection: AIORabbitMQ, batch_size: int = 100) -> None:
+        """Python RabbitMQ producer, collects messages sent by many concurrent tasks and publishes them in batches
+        from a background task, so their publisher confirms are awaited together instead of one by one
+
+        Args:
+            connection (AIORabbitMQ): Connected `AIORabbitMQ` used to publish
+            batch_size (int, optional): Maximum number of messages published per batch. Defaults to 100
+        """
+        self.connection = connection
+        self.batch_size = batch_size
+        self._queue = None
+        self._task = None
+
+    def start(self) -> None:
+        """Start the background publishing task. Called by `send` if it hasn't been started yet
+        """
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._producer_loop())
+
+    async def close(self) -> None:
+        """Wait until all queued messages are published, then stop the background publishing task
+        """
+        if self._task is None:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._queue = None
+        self._task = None
+
+    async def send(self, queue: str, body: MessageBody, exchange: str = '') -> None:
+        """Queue message/body to be published to RabbitMQ channel queue, returns once it has been published
+
+        Args:
+            queue (str): Queue name
+            body (MessageBody): Message/body payload, or already encoded bytes
+            exchange (str, optional): Exchange name. Defaults to ''
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((queue, self.connection.prepare(body), exchange, future))
+        await future
+
+    async def _producer_loop(self) -> None:
+        """Take all queued messages (up to `batch_size`) on each wakeup and publish them at once
+        """
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            # Declare each queue/exchange once per batch, concurrent declarations would all miss the cache
+            exchanges = {}
+            for queue, _, exchange, _ in batch:
+                if (queue, exchange) not in exchanges:
+                    try:
+                        # Reopen channel closed by the broker (e.g. a publish of the previous batch to a deleted exchange)
+                        await self.connection._ensure_channel()
+                        await self.connection._declare_queue(queue)
+                        exchanges[queue, exchange] = await self.connection._get_exchange(exchange)
+                    except Exception as e:
+                        exchanges[queue, exchange] = e
+            publishes = []
+            for queue, message, exchange, future in batch:
+                target = exchanges[queue, exchange]
+                if isinstance(target, Exception):
+                    self._resolve(future, target)
+                    self._queue.task_done()
+                else:
+                    publishes.append((target.publish(message, queue), future))
+            results = await asyncio.gather(*(publish for publish, _ in publishes), return_exceptions=True)
+            for (_, future), result in zip(publishes, results):
+                self._resolve(future, result)
+                self._queue.task_done()
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: object) -> None:
+        """Hand the publish result (or error) over to the waiting `send` caller
+
+        Args:
+            future (asyncio.Future): Future awaited by the caller
+            result (object): Publish result, or the exception it raised
+        """
+        if future.done():  # Caller may have been cancelled meanwhile
+            return
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(None)
@@ -1,7 +1,51 @@
+import threading
+from typing import Union
+
+try:
+    import msgpack
+except ImportError:  # Optional, only needed by `MsgPackPayload`
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # Optional, only needed by `OrjsonPayload`
+    orjson = None
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        raise ImportError('MsgPackPayload requires msgpack: pip install rctiplus-rabbitmq-python-sdk[msgpack]')
+
+
+_local = threading.local()
+
+
+def _msgpack_packer() -> 'msgpack.Packer':
+    """Get this thread's `msgpack.Packer`. `msgpack.packb` builds a new packer (and buffer) on every call,
+    a long-lived one keeps reusing its internal buffer. Packers are not thread-safe, hence one per thread
+
+    Returns:
+        msgpack.Packer: Packer of the current thread
+    """
+    packer = getattr(_local, 'msgpack_packer', None)
+    if packer is None:
+        _require_msgpack()
+        packer = _local.msgpack_packer = msgpack.Packer(use_bin_type=True)
+    return packer
+
+
+def _require_orjson() -> None:
+    if orjson is None:
+        raise ImportError('OrjsonPayload requires orjson: pip install rctiplus-rabbitmq-python-sdk[orjson]')
+
+
 class MessagePayload:
     """Python RabbitMQ message payload
     """
 
+    __slots__ = ()  # Lets subclasses define `__slots__` and drop the per-instance `__dict__`
+    content_type = None  # Sent as the message `content_type` property, e.g. 'application/json'
+
     @classmethod
     def from_str(cls, message: str) -> 'MessagePayload':
         """Generate data from specified string payload message format
@@ -11,6 +55,16 @@ class MessagePayload:
         """
         raise NotImplementedError()
 
+    @classmethod
+    def from_bytes(cls, message: bytes) -> 'MessagePayload':
+        """Generate data from specified bytes payload message format.
+        Override this for binary formats, by default it decodes the message as UTF-8 and calls `from_str`
+
+        Returns:
+            MessagePayload: Generated data
+        """
+        return cls.from_str(message.decode('utf-8'))
+
     def __str__(self) -> str:
         """Convert specified data format to string payload message
 
@@ -21,3 +75,142 @@ class MessagePayload:
             str: String payload message
         """
         raise NotImplementedError()
+
+    def __bytes__(self) -> bytes:
+        """Convert specified data format to bytes payload message, this is what gets published.
+        Override this to encode straight to bytes and skip the `str` round-trip
+
+        Returns:
+            bytes: Bytes payload message
+        """
+        return str(self).encode('utf-8')
+
+
+class _AttributesPayload(MessagePayload):
+    """Python RabbitMQ payload base that encodes instance attributes as a map
+    """
+
+    __slots__ = ()
+    _slot_fields = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            fields.extend(name for name in slots if name not in ('__dict__', '__weakref__'))
+        cls._slot_fields = tuple(fields)
+
+    def to_dict(self) -> dict:
+        """Get the attributes to be encoded (`__slots__` and `__dict__` ones), override this to encode a different set of fields
+
+        Returns:
+            dict: Payload attributes
+        """
+        data = {name: getattr(self, name) for name in self._slot_fields if hasattr(self, name)}
+        if hasattr(self, '__dict__'):
+            data.update(self.__dict__)
+        return data
+
+
+class MsgPackPayload(_AttributesPayload):
+    """Python RabbitMQ MessagePack payload, packs instance attributes as a map.
+    Requires `msgpack` (pip install rctiplus-rabbitmq-python-sdk[msgpack])
+    """
+
+    __slots__ = ()
+    content_type = 'application/msgpack'
+
+    @classmethod
+    def from_bytes(cls, message: bytes) -> 'MsgPackPayload':
+        """Generate data from MessagePack bytes payload message, attributes are passed as keyword arguments
+
+        Returns:
+            MsgPackPayload: Generated data
+        """
+        _require_msgpack()
+        return cls(**msgpack.unpackb(message, raw=False))
+
+    def __str__(self) -> str:
+        """Human readable form of the payload, the message itself is binary
+
+        Returns:
+            str: Payload attributes
+        """
+        return str(self.to_dict())
+
+    def __bytes__(self) -> bytes:
+        """Convert data to MessagePack bytes payload message
+
+        Returns:
+            bytes: Bytes payload message
+        """
+        return _msgpack_packer().pack(self.to_dict())
+
+
+class OrjsonPayload(_AttributesPayload):
+    """Python RabbitMQ JSON payload, encodes instance attributes as a JSON object with `orjson` (one C call, straight to bytes).
+    Requires `orjson` (pip install rctiplus-rabbitmq-python-sdk[orjson])
+    """
+
+    __slots__ = ()
+    content_type = 'application/json'
+
+    @classmethod
+    def from_str(cls, message: str) -> 'OrjsonPayload':
+        """Generate data from JSON string payload message, attributes are passed as keyword arguments
+
+        Returns:
+            OrjsonPayload: Generated data
+        """
+        _require_orjson()
+        return cls(**orjson.loads(message))
+
+    @classmethod
+    def from_bytes(cls, message: bytes) -> 'OrjsonPayload':
+        """Generate data from JSON bytes payload message, attributes are passed as keyword arguments
+
+        Returns:
+            OrjsonPayload: Generated data
+        """
+        _require_orjson()
+        return cls(**orjson.loads(message))
+
+    def __str__(self) -> str:
+        """Convert data to JSON string payload message
+
+        Returns:
+            str: String payload message
+        """
+        return bytes(self).decode('utf-8')
+
+    def __bytes__(self) -> bytes:
+        """Convert data to JSON bytes payload message
+
+        Returns:
+            bytes: Bytes payload message
+        """
+        _require_orjson()
+        return orjson.dumps(self.to_dict())
+
+
+MessageBody = Union[MessagePayload, bytes, bytearray, memoryview]  # Already encoded bodies are published as they are
+
+
+def _encode_body(body: MessageBody) -> bytes:
+    """Encode message/body to be published. Bytes-like bodies are passed through, payloads use `__bytes__`,
+    anything else is sent as its UTF-8 encoded `str`
+
+    Args:
+        body (MessageBody): Message/body payload, or already encoded bytes
+
+    Returns:
+        bytes: Bytes payload message
+    """
+    if isinstance(body, bytes):
+        return body
+    if isinstance(body, (bytearray, memoryview)) or hasattr(type(body), '__bytes__'):
+        return bytes(body)
+    return str(body).encode('utf-8')
@@ -1,16 +1,19 @@
 import pika
-from rctiplus_rabbitmq_python_sdk import MessagePayload
-from typing import Callable
+from rctiplus_rabbitmq_python_sdk import MessageBody
+from rctiplus_rabbitmq_python_sdk.message_payload import _encode_body
+from typing import Callable, Iterable
 
 class RabbitMQ:
 
-    def __init__(self, durable: bool = False, auto_ack: bool = True, auto_delete: bool = False) -> None:
+    def __init__(self, durable: bool = False, auto_ack: bool = True, auto_delete: bool = False,
+                 prefetch_count: int = 100) -> None:
         """Python RabbitMQ library
 
         Args:
             durable (bool, optional): Durable mode, prevent from losing messages if RabbitMQ server stops or restarts. Defaults to False
             auto_ack (bool, optional): Auto acknowledgements, remove messages immadiatelly after being received. Defaults to True
             auto_delete (bool, optional): Delete created queue after consumer cancels or disconnects. Defaults to False
+            prefetch_count (int, optional): Maximum unacknowledged messages delivered to the consumer at once, 0 for unlimited. Only applies when `auto_ack` is False. Defaults to 100
         """
         self.durable = durable
         self.delivery_mode = None
@@ -18,8 +21,11 @@ class RabbitMQ:
             self.delivery_mode = 2 # Make messages persistence if durable mode active
         self.auto_ack = auto_ack
         self.auto_delete = auto_delete
+        self.prefetch_count = prefetch_count
         self.connection = None
         self.channel = None
+        self._declared_queues = set()
+        self._properties = {}  # Publish properties per content type, built once and reused for every message
 
     def connect(self, host: str, port: int, username: str, password: str) -> None:
         """Connect to RabbitMQ server
@@ -39,25 +45,62 @@ class RabbitMQ:
             )
         )
         self.channel = self.connection.channel()
+        self.channel.basic_qos(prefetch_count=self.prefetch_count)
+        self._declared_queues = set()  # Declarations belong to the channel, so start fresh on each connect
 
     def disconnect(self) -> None:
         """Disconnect RabbitMQ connection
         """
         self.connection.close()
 
-    def send(self, queue: str, body: MessagePayload, exchange: str = '') -> None:
+    def _declare_queue(self, queue: str) -> None:
+        """Declare channel queue once, skip the AMQP round-trip if it has already been declared
+
+        Args:
+            queue (str): Queue name
+        """
+        if queue in self._declared_queues:
+            return
+        self.channel.queue_declare(queue=queue, durable=self.durable, auto_delete=self.auto_delete)
+        self._declared_queues.add(queue)
+
+    def _publish(self, queue: str, body: MessageBody, exchange: str) -> None:
+        """Publish message/body to RabbitMQ channel queue without declaring it
+
+        Args:
+            queue (str): Queue name
+            body (MessageBody): Message/body payload, or already encoded bytes
+            exchange (str): Exchange name
+        """
+        content_type = getattr(body, 'content_type', None)
+        properties = self._properties.get(content_type)
+        if properties is None:
+            properties = pika.BasicProperties(delivery_mode=self.delivery_mode, content_type=content_type)
+            self._properties[content_type] = properties
+        self.channel.basic_publish(exchange=exchange, routing_key=queue, body=_encode_body(body), properties=properties)
+
+    def send(self, queue: str, body: MessageBody, exchange: str = '') -> None:
         """Send message/body to RabbitMQ channel queue
 
         Args:
             queue (str): Queue name
-            body (MessagePayload): Message/body payload
+            body (MessageBody): Message/body payload, or already encoded bytes
             exchange (str, optional): Exchange name. Defaults to ''
         """
-        self.channel.queue_declare(queue=queue, durable=self.durable, auto_delete=self.auto_delete)
-        self.channel.basic_publish(
-            exchange=exchange, routing_key=queue, body=str(body), properties=pika.BasicProperties(
-                delivery_mode=self.delivery_mode
-            ))
+        self._declare_queue(queue)
+        self._publish(queue, body, exchange)
+
+    def send_many(self, queue: str, bodies: Iterable[MessageBody], exchange: str = '') -> None:
+        """Send many messages/bodies to RabbitMQ channel queue, the queue is only declared once
+
+        Args:
+            queue (str): Queue name
+            bodies (Iterable[MessageBody]): Message/body payloads, or already encoded bytes
+            exchange (str, optional): Exchange name. Defaults to ''
+        """
+        self._declare_queue(queue)
+        for body in bodies:
+            self._publish(queue, body, exchange)
 
     def receive(self, queue: str, callback: Callable[
         [
@@ -73,7 +116,7 @@ class RabbitMQ:
             queue (str): Queue name
             callback (Callable[ [ pika.adapters.blocking_connection.BlockingChannel, pika.spec.Basic.Deliver, pika.spec.BasicProperties, bytes ], None ]): Callback to be called after receiving a message
         """
-        self.channel.queue_declare(queue=queue, durable=self.durable, auto_delete=self.auto_delete)
+        self._declare_queue(queue)
         self.channel.basic_consume(
             queue=queue, on_message_callback=callback, auto_ack=self.auto_ack)
         self.channel.start_consuming()
@@ -85,6 +128,7 @@ class RabbitMQ:
             queue (str): Queue name to be deleted
         """
         self.channel.queue_delete(queue=queue)
+        self._declared_queues.discard(queue)
     
     def delete_exchange(self, exchange: str) -> None:
         """Delete channel exchange
@@ -0,0 +1,107 @@
+import pika
+from queue import Queue
+from rctiplus_rabbitmq_python_sdk import MessageBody
+from rctiplus_rabbitmq_python_sdk.rabbitmq import RabbitMQ
+from typing import Iterable
+
+class RabbitMQPool:
+
+    def __init__(self, size: int = 4, durable: bool = False, auto_delete: bool = False) -> None:
+        """Python RabbitMQ library, publishes through a pool of connections so threads don't have to
+        share (or open) a single connection. Pika connections are not thread-safe, each one is used by one thread at a time
+
+        Args:
+            size (int, optional): Number of connections in the pool. Defaults to 4
+            durable (bool, optional): Durable mode, prevent from losing messages if RabbitMQ server stops or restarts. Defaults to False
+            auto_delete (bool, optional): Delete created queue after consumer cancels or disconnects. Defaults to False
+        """
+        self.size = size
+        self.durable = durable
+        self.auto_delete = auto_delete
+        self.pool = None
+        self._connect_kwargs = None
+
+    def connect(self, host: str, port: int, username: str, password: str) -> None:
+        """Open all pooled connections to RabbitMQ server
+
+        Args:
+            host (str): RabbitMQ host
+            port (int): RabbitMQ port
+            username (str): RabbitMQ username
+            password (str): RabbitMQ password
+        """
+        self._connect_kwargs = {'host': host, 'port': port, 'username': username, 'password': password}
+        self.pool = Queue(maxsize=self.size)
+        for _ in range(self.size):
+            self.pool.put(self._new_connection())
+
+    def _new_connection(self) -> RabbitMQ:
+        """Open a new connection to be put in the pool
+
+        Returns:
+            RabbitMQ: Connected `RabbitMQ`
+        """
+        conn = RabbitMQ(durable=self.durable, auto_delete=self.auto_delete)
+        conn.connect(**self._connect_kwargs)
+        return conn
+
+    def _replace(self, conn: RabbitMQ) -> RabbitMQ:
+        """Replace a broken pooled connection (e.g. dropped after missed heartbeats) with a new one
+
+        Args:
+            conn (RabbitMQ): Broken connection
+
+        Returns:
+            RabbitMQ: New connection, or the broken one if the server can't be reached yet (it's replaced on its next failure)
+        """
+        try:
+            conn.disconnect()
+        except pika.exceptions.AMQPError:
+            pass
+        try:
+            return self._new_connection()
+        except pika.exceptions.AMQPConnectionError:
+            return conn
+
+    def disconnect(self) -> None:
+        """Disconnect all pooled connections, waits for connections in use to be released
+        """
+        for _ in range(self.size):
+            try:
+                self.pool.get().disconnect()
+            except pika.exceptions.AMQPError:
+                pass  # Already broken, nothing left to close
+
+    def send(self, queue: str, body: MessageBody, exchange: str = '') -> None:
+        """Send message/body to RabbitMQ channel queue using a pooled connection
+
+        Args:
+            queue (str): Queue name
+            body (MessageBody): Message/body payload, or already encoded bytes
+            exchange (str, optional): Exchange name. Defaults to ''
+        """
+        conn = self.pool.get()
+        try:
+            conn.send(queue, body, exchange)
+        except (pika.exceptions.AMQPConnectionError, pika.exceptions.AMQPChannelError):
+            conn = self._replace(conn)
+            raise
+        finally:
+            self.pool.put(conn)
+
+    def send_many(self, queue: str, bodies: Iterable[MessageBody], exchange: str = '') -> None:
+        """Send many messages/bodies to RabbitMQ channel queue using a pooled connection
+
+        Args:
+            queue (str): Queue name
+            bodies (Iterable[MessageBody]): Message/body payloads, or already encoded bytes
+            exchange (str, optional): Exchange name. Defaults to ''
+        """
+        conn = self.pool.get()
+        try:
+            conn.send_many(queue, bodies, exchange)
+        except (pika.exceptions.AMQPConnectionError, pika.exceptions.AMQPChannelError):
+            conn = self._replace(conn)
+            raise
+        finally:
+            self.pool.put(conn)
@@ -1,17 +1,16 @@
-import sys
+import argparse
+import importlib
+
+TESTS = {
+    'send': 'tests.send',
+    'receive': 'tests.receive',
+    'aio_send': 'tests.aio_send',
+    'aio_receive': 'tests.aio_receive',
+    'aio_get_queues': 'tests.aio_get_queues',
+}
 
 if __name__ == '__main__':
-    try:
-        test_name = sys.argv[1]
-    except:
-        test_name = None
-    if test_name == 'send':
-        import tests.send
-    if test_name == 'receive':
-        import tests.receive
-    if test_name == 'aio_send':
-        import tests.aio_send
-    if test_name == 'aio_receive':
-        import tests.aio_receive
-    if test_name == 'aio_get_queues':
-        import tests.aio_get_queues
+    parser = argparse.ArgumentParser(description='Run an example against a local RabbitMQ server')
+    parser.add_argument('test_name', choices=TESTS.keys())
+    args = parser.parse_args()
+    importlib.import_module(TESTS[args.test_name])
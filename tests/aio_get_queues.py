@@ -3,10 +3,10 @@ from rctiplus_rabbitmq_python_sdk import AIORabbitMQ
 
 
 # Main function
-async def main(loop):
+async def main():
 
     # Connect to RabbitMQ
-    conn = AIORabbitMQ(loop)
+    conn = AIORabbitMQ()
     await conn.connect(host='localhost', port=5672, username='guest', password='guest')
     
     async with conn.connection:
@@ -16,5 +16,5 @@ async def main(loop):
 
 # Event loop
 loop = asyncio.get_event_loop()
-loop.run_until_complete(main(loop))
+loop.run_until_complete(main())
 loop.close()
@@ -1,4 +1,4 @@
-import json
+import orjson
 import asyncio
 from rctiplus_rabbitmq_python_sdk import AIORabbitMQ, MessagePayload
 
@@ -8,6 +8,8 @@ class JSONPayload(MessagePayload):
     """Example class to handle JSON payload
     """
 
+    __slots__ = ('firstname', 'lastname')
+
     def __init__(self, firstname: str, lastname: str) -> None:
         self.firstname = firstname
         self.lastname = lastname
@@ -18,11 +20,19 @@ class JSONPayload(MessagePayload):
         Returns:
             str: String payload message
         """
-        return json.dumps({
+        return bytes(self).decode('utf-8')
+
+    def __bytes__(self) -> bytes:
+        """Convert JSON to bytes payload message, `orjson` encodes straight to bytes
+
+        Returns:
+            bytes: Bytes payload message
+        """
+        return orjson.dumps({
             'firstname': self.firstname,
             'lastname': self.lastname
         })
-    
+
     @classmethod
     def from_str(cls, message: str) -> 'JSONPayload':
         """Generate data from JSON string payload message
@@ -30,15 +40,15 @@ class JSONPayload(MessagePayload):
         Returns:
             JSONPayload: Generated data
         """
-        payload = json.loads(message)
+        payload = orjson.loads(message)
         return cls(firstname=payload['firstname'], lastname=payload['lastname'])
 
 
 # Main function
-async def main(loop):
+async def main():
 
     # Connect to RabbitMQ
-    conn = AIORabbitMQ(loop)
+    conn = AIORabbitMQ()
     await conn.connect(host='localhost', port=5672, username='guest', password='guest')
     
     async with conn.connection:
@@ -50,5 +60,5 @@ async def main(loop):
 
 # Event loop
 loop = asyncio.get_event_loop()
-loop.run_until_complete(main(loop))
+loop.run_until_complete(main())
 loop.close()
\ No newline at end of file
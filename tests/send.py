@@ -1,4 +1,4 @@
-import json
+import orjson
 from rctiplus_rabbitmq_python_sdk import RabbitMQ, MessagePayload
 
 
@@ -7,6 +7,8 @@ class JSONPayload(MessagePayload):
     """Example class to handle JSON payload
     """
 
+    __slots__ = ('firstname', 'lastname')
+
     def __init__(self, firstname: str, lastname: str) -> None:
         self.firstname = firstname
         self.lastname = lastname
@@ -17,11 +19,19 @@ class JSONPayload(MessagePayload):
         Returns:
             str: String payload message
         """
-        return json.dumps({
+        return bytes(self).decode('utf-8')
+
+    def __bytes__(self) -> bytes:
+        """Convert JSON to bytes payload message, `orjson` encodes straight to bytes
+
+        Returns:
+            bytes: Bytes payload message
+        """
+        return orjson.dumps({
             'firstname': self.firstname,
             'lastname': self.lastname
         })
-    
+
     @classmethod
     def from_str(cls, message: str) -> 'JSONPayload':
         """Generate data from JSON string payload message
@@ -29,7 +39,7 @@ class JSONPayload(MessagePayload):
         Returns:
             JSONPayload: Generated data
         """
-        payload = json.loads(message)
+        payload = orjson.loads(message)
         return cls(firstname=payload['firstname'], lastname=payload['lastname'])
 
 